@@ -3,42 +3,88 @@
 Trader Profile Analysis - Based on Real BitMEX Trading Data
 """
 
-import csv
-import json
-from datetime import datetime, timedelta
-from collections import defaultdict
 import os
+import pathlib
+
+import orjson
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from numba import njit
+
+# One Arrow parse batch; sized to stay L2-resident during conversion
+CSV_BLOCK_SIZE = 262144
+
+# Resolved once at import; main() and test harnesses reuse the same map
+BASE_DIR = pathlib.Path(__file__).resolve().parent.parent
+PATHS = {
+    'orders': BASE_DIR / 'bitmex_orders.csv',
+    'wallet': BASE_DIR / 'bitmex_wallet_history.csv',
+    'executions': BASE_DIR / 'bitmex_executions.csv',
+    'output': BASE_DIR / 'trader_profile_analysis.json',
+}
+
+ORDERS_COLUMNS = ['orderID', 'symbol', 'side', 'ordType', 'orderQty', 'price',
+                  'stopPx', 'avgPx', 'cumQty', 'ordStatus', 'timestamp', 'text']
+WALLET_COLUMNS = ['transactID', 'account', 'currency', 'transactType', 'amount',
+                  'fee', 'transactStatus', 'address', 'tx', 'text', 'timestamp',
+                  'walletBalance', 'marginBalance']
+EXECUTIONS_COLUMNS = ['execID', 'orderID', 'symbol', 'side', 'lastQty', 'lastPx',
+                      'execType', 'ordType', 'ordStatus', 'execCost', 'execComm',
+                      'timestamp', 'text']
+
+@njit(cache=True)
+def risk_stats(sizes):
+    """Aggregate order sizes: (avg, max, min, large-order ratio %)"""
+    avg = sizes.mean()
+    mx = sizes.max()
+    mn = sizes.min()
+    large_ratio = (sizes > 10000).sum() / sizes.size * 100
+    return avg, mx, mn, large_ratio
+
+def clamp10(value):
+    """Clamp a raw score into the 1-10 band (branchless, batch-friendly)"""
+    return int(np.clip(value, 1, 10))
+
+def read_csv_columnar(filepath, dtype):
+    """Parse a CSV with Arrow's multi-threaded reader and convert columnar"""
+    table = pacsv.read_csv(
+        filepath,
+        read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        convert_options=pacsv.ConvertOptions(column_types={'timestamp': pa.string()})
+    )
+    return table.to_pandas(self_destruct=True).astype(dtype)
 
 def load_orders(filepath):
-    """Load order history from CSV"""
-    orders = []
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            orders.append(row)
-    return orders
+    """Load order history from CSV into a columnar DataFrame"""
+    if not os.path.exists(filepath):
+        return pd.DataFrame(columns=ORDERS_COLUMNS)
+    return read_csv_columnar(filepath, {'ordStatus': 'category',
+                                        'ordType': 'category',
+                                        'orderQty': 'float64',
+                                        'timestamp': 'str'})
 
 def load_wallet_history(filepath):
-    """Load wallet history from CSV"""
-    history = []
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            history.append(row)
-    return history
+    """Load wallet history from CSV into a columnar DataFrame"""
+    if not os.path.exists(filepath):
+        return pd.DataFrame(columns=WALLET_COLUMNS)
+    return read_csv_columnar(filepath, {'transactType': 'category',
+                                        'amount': 'float64',
+                                        'timestamp': 'str'})
 
 def load_executions(filepath):
-    """Load execution history from CSV"""
-    executions = []
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            executions.append(row)
-    return executions
-
-def analyze_trader_profile(orders, wallet_history, executions):
+    """Load execution history from CSV into a columnar DataFrame"""
+    if not os.path.exists(filepath):
+        return pd.DataFrame(columns=EXECUTIONS_COLUMNS)
+    return read_csv_columnar(filepath, {'ordType': 'category',
+                                        'side': 'category',
+                                        'timestamp': 'str'})
+
+def analyze_trader_profile_df(orders, wallet_history, executions):
     """
-    Analyze trader profile based on trading data
+    Analyze trader profile from schema-typed DataFrames (fast path)
     Returns comprehensive trader profile analysis results
     """
 
@@ -52,76 +98,57 @@ def analyze_trader_profile(orders, wallet_history, executions):
     }
 
     # ========== Basic Statistics ==========
+    # One scan of the status column covers every order-state count; only
+    # the filled columns used downstream get materialized
     total_orders = len(orders)
-    filled_orders = [o for o in orders if o.get('ordStatus') == 'Filled']
-    canceled_orders = [o for o in orders if o.get('ordStatus') == 'Canceled']
+    status_counts = orders['ordStatus'].value_counts() if total_orders > 0 else {}
+    filled_count = int(status_counts.get('Filled', 0))
+    canceled_count = int(status_counts.get('Canceled', 0))
+    filled_orders = orders.loc[orders['ordStatus'] == 'Filled',
+                               ['timestamp', 'orderQty']]
 
     # Order type statistics
-    order_types = defaultdict(int)
-    for o in orders:
-        order_types[o.get('ordType', 'Unknown')] += 1
+    order_types = orders['ordType'].value_counts().to_dict() if total_orders > 0 else {}
 
     profile["basic_stats"] = {
         "total_orders": total_orders,
-        "filled_orders": len(filled_orders),
-        "canceled_orders": len(canceled_orders),
-        "fill_rate": round(len(filled_orders) / total_orders * 100, 2) if total_orders > 0 else 0,
-        "order_types": dict(order_types)
+        "filled_orders": filled_count,
+        "canceled_orders": canceled_count,
+        "fill_rate": round(filled_count / total_orders * 100, 2) if total_orders > 0 else 0,
+        "order_types": order_types
     }
 
     # ========== Trading Time Analysis ==========
-    if filled_orders:
-        timestamps = []
-        for o in filled_orders:
-            try:
-                ts = datetime.fromisoformat(o.get('timestamp', '').replace('Z', '+00:00'))
-                timestamps.append(ts)
-            except:
-                pass
-
-        if timestamps:
-            # Hourly distribution
-            hour_distribution = defaultdict(int)
-            for ts in timestamps:
-                hour_distribution[ts.hour] += 1
-
-            # Weekly distribution
-            weekday_distribution = defaultdict(int)
-            for ts in timestamps:
-                weekday_distribution[ts.weekday()] += 1
+    if not filled_orders.empty:
+        # Parse all timestamps in one vectorized pass; invalid rows drop out
+        timestamps = pd.to_datetime(filled_orders['timestamp'], utc=True,
+                                    errors='coerce').dropna()
+
+        if not timestamps.empty:
+            # Hourly / weekly histograms in one C pass each
+            hour_distribution = np.bincount(timestamps.dt.hour.to_numpy(), minlength=24)
+            weekday_distribution = np.bincount(timestamps.dt.weekday.to_numpy(), minlength=7)
 
             # Find most active periods
-            most_active_hour = max(hour_distribution, key=hour_distribution.get)
-            most_active_day = max(weekday_distribution, key=weekday_distribution.get)
+            most_active_hour = int(hour_distribution.argmax())
+            most_active_day = int(weekday_distribution.argmax())
 
-            profile["trading_patterns"]["hour_distribution"] = dict(hour_distribution)
-            profile["trading_patterns"]["weekday_distribution"] = dict(weekday_distribution)
+            profile["trading_patterns"]["hour_distribution"] = dict(enumerate(hour_distribution.tolist()))
+            profile["trading_patterns"]["weekday_distribution"] = dict(enumerate(weekday_distribution.tolist()))
             profile["trading_patterns"]["most_active_hour"] = most_active_hour
             profile["trading_patterns"]["most_active_day"] = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"][most_active_day]
 
     # ========== Risk Preference Analysis ==========
-    # Analyze order sizes
-    order_sizes = []
-    for o in filled_orders:
-        try:
-            size = abs(float(o.get('orderQty', 0)))
-            if size > 0:
-                order_sizes.append(size)
-        except:
-            pass
-
-    if order_sizes:
-        avg_order_size = sum(order_sizes) / len(order_sizes)
-        max_order_size = max(order_sizes)
-        min_order_size = min(order_sizes)
-
-        # Large order ratio (>10000)
-        large_orders = [s for s in order_sizes if s > 10000]
-        large_order_ratio = len(large_orders) / len(order_sizes) * 100
+    # Analyze order sizes (columnar: parse once, filter with a mask)
+    sizes = filled_orders['orderQty'].abs().dropna()
+    sizes_arr = sizes[sizes > 0].to_numpy(dtype=np.float64)
+
+    if sizes_arr.size > 0:
+        avg_order_size, max_order_size, min_order_size, large_order_ratio = risk_stats(sizes_arr)
 
         # Risk score (1-10)
         # Based on large order ratio and order size volatility
-        risk_score = min(10, max(1, int(large_order_ratio / 5 + 3)))
+        risk_score = clamp10(large_order_ratio / 5 + 3)
 
         profile["risk_preference"] = {
             "avg_order_size": round(avg_order_size, 2),
@@ -133,27 +160,24 @@ def analyze_trader_profile(orders, wallet_history, executions):
         }
 
     # ========== Trading Frequency Analysis ==========
-    if timestamps and len(timestamps) >= 2:
+    if len(timestamps) >= 2:
         # Calculate trading span
-        first_trade = min(timestamps)
-        last_trade = max(timestamps)
+        first_trade = timestamps.min()
+        last_trade = timestamps.max()
         trading_days = (last_trade - first_trade).days or 1
 
         # Daily average trades
-        daily_trades = len(filled_orders) / trading_days
-
-        # Calculate trade intervals
-        sorted_ts = sorted(timestamps)
-        intervals = []
-        for i in range(1, len(sorted_ts)):
-            interval = (sorted_ts[i] - sorted_ts[i-1]).total_seconds() / 60  # minutes
-            if interval > 0 and interval < 60 * 24 * 7:  # exclude outliers
-                intervals.append(interval)
+        daily_trades = filled_count / trading_days
 
-        avg_interval = sum(intervals) / len(intervals) if intervals else 0
+        # Calculate trade intervals from sorted int64 epochs in one diff pass
+        epoch_ns = np.sort(timestamps.dt.tz_localize(None).to_numpy()
+                           .astype('datetime64[ns]').view(np.int64))
+        intervals_min = np.diff(epoch_ns) / 60e9
+        interval_mask = (intervals_min > 0) & (intervals_min < 60 * 24 * 7)  # exclude outliers
+        avg_interval = float(intervals_min[interval_mask].mean()) if interval_mask.any() else 0.0
 
         # Frequency score
-        frequency_score = min(10, max(1, int(daily_trades / 5)))
+        frequency_score = clamp10(daily_trades / 5)
 
         profile["trading_frequency"] = {
             "total_trading_days": trading_days,
@@ -172,11 +196,11 @@ def analyze_trader_profile(orders, wallet_history, executions):
     limit_ratio = limit_orders / total_lm * 100 if total_lm > 0 else 0
 
     # Discipline score - higher limit order ratio = more disciplined
-    discipline_score = min(10, max(1, int(limit_ratio / 10)))
+    discipline_score = clamp10(limit_ratio / 10)
 
     # Patience score - based on cancel order ratio (fewer cancels = more patient)
-    cancel_ratio = len(canceled_orders) / total_orders * 100 if total_orders > 0 else 0
-    patience_score = min(10, max(1, int(10 - cancel_ratio / 5)))
+    cancel_ratio = canceled_count / total_orders * 100 if total_orders > 0 else 0
+    patience_score = clamp10(10 - cancel_ratio / 5)
 
     profile["discipline_scores"] = {
         "limit_order_ratio": round(limit_ratio, 2),
@@ -188,34 +212,28 @@ def analyze_trader_profile(orders, wallet_history, executions):
     }
 
     # ========== PnL Analysis (from wallet history) ==========
-    pnl_entries = [w for w in wallet_history if w.get('transactType') == 'RealisedPNL']
-
-    if pnl_entries:
-        pnl_amounts = []
-        for entry in pnl_entries:
-            try:
-                amount = float(entry.get('amount', 0)) / 100000000  # Convert satoshis to BTC
-                pnl_amounts.append(amount)
-            except:
-                pass
-
-        if pnl_amounts:
-            total_pnl = sum(pnl_amounts)
-            winning_trades = [p for p in pnl_amounts if p > 0]
-            losing_trades = [p for p in pnl_amounts if p < 0]
-
-            win_rate = len(winning_trades) / len(pnl_amounts) * 100 if pnl_amounts else 0
-            avg_win = sum(winning_trades) / len(winning_trades) if winning_trades else 0
-            avg_loss = abs(sum(losing_trades) / len(losing_trades)) if losing_trades else 0
+    pnl_entries = wallet_history[wallet_history['transactType'] == 'RealisedPNL']
+
+    if not pnl_entries.empty:
+        pnl = pnl_entries['amount'].dropna().to_numpy(dtype=np.float64) / 100000000  # satoshis to BTC
+
+        if pnl.size > 0:
+            win_mask = pnl > 0
+            loss_mask = pnl < 0
+
+            total_pnl = pnl.sum()
+            win_rate = win_mask.mean() * 100
+            avg_win = pnl[win_mask].mean() if win_mask.any() else 0.0
+            avg_loss = -pnl[loss_mask].mean() if loss_mask.any() else 0.0
 
             # Profit factor
             profit_factor = avg_win / avg_loss if avg_loss > 0 else float('inf')
 
             profile["pnl_analysis"] = {
                 "total_pnl_btc": round(total_pnl, 8),
-                "total_trades": len(pnl_amounts),
-                "winning_trades": len(winning_trades),
-                "losing_trades": len(losing_trades),
+                "total_trades": int(pnl.size),
+                "winning_trades": int(win_mask.sum()),
+                "losing_trades": int(loss_mask.sum()),
                 "win_rate": round(win_rate, 2),
                 "avg_win_btc": round(avg_win, 8),
                 "avg_loss_btc": round(avg_loss, 8),
@@ -262,23 +280,33 @@ def analyze_trader_profile(orders, wallet_history, executions):
 
     return profile
 
-def main():
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+def analyze_trader_profile(orders, wallet_history, executions):
+    """
+    Analyze trader profile based on trading data
+    Accepts the DataFrames produced by the loaders, or legacy lists of
+    row dicts which are converted before dispatching to the fast path
+    """
+    if not isinstance(orders, pd.DataFrame):
+        orders = pd.DataFrame(orders, columns=ORDERS_COLUMNS)
+        orders['orderQty'] = pd.to_numeric(orders['orderQty'], errors='coerce')
+    if not isinstance(wallet_history, pd.DataFrame):
+        wallet_history = pd.DataFrame(wallet_history, columns=WALLET_COLUMNS)
+        wallet_history['amount'] = pd.to_numeric(wallet_history['amount'], errors='coerce')
+    if not isinstance(executions, pd.DataFrame):
+        executions = pd.DataFrame(executions, columns=EXECUTIONS_COLUMNS)
+    return analyze_trader_profile_df(orders, wallet_history, executions)
 
+def main():
     print("═" * 60)
     print("        Trader Profile Analysis")
     print("═" * 60)
     print()
 
     # Load data
-    orders_file = os.path.join(base_dir, 'bitmex_orders.csv')
-    wallet_file = os.path.join(base_dir, 'bitmex_wallet_history.csv')
-    executions_file = os.path.join(base_dir, 'bitmex_executions.csv')
-
     print("Loading data...")
-    orders = load_orders(orders_file) if os.path.exists(orders_file) else []
-    wallet_history = load_wallet_history(wallet_file) if os.path.exists(wallet_file) else []
-    executions = load_executions(executions_file) if os.path.exists(executions_file) else []
+    orders = load_orders(PATHS['orders'])
+    wallet_history = load_wallet_history(PATHS['wallet'])
+    executions = load_executions(PATHS['executions'])
 
     print(f"  Orders: {len(orders)}")
     print(f"  Wallet History: {len(wallet_history)}")
@@ -369,9 +397,11 @@ def main():
     print("═" * 60)
 
     # Save to JSON
-    output_file = os.path.join(base_dir, 'trader_profile_analysis.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(profile, f, ensure_ascii=False, indent=2)
+    output_file = PATHS['output']
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(profile, option=orjson.OPT_INDENT_2
+                             | orjson.OPT_NON_STR_KEYS
+                             | orjson.OPT_SERIALIZE_NUMPY))
     print(f"\n✅ Analysis results saved to: {output_file}")
 
 if __name__ == '__main__':
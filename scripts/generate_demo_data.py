@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Demo Data Generator - Synthetic BitMEX-style trading data for local development
+Produces OHLCV candles, order/execution/wallet history CSVs and an account
+summary JSON matching the formats documented in DATA_FORMATS.md
+"""
+
+import csv
+import multiprocessing
+import os
+import pathlib
+import zlib
+from datetime import datetime, timedelta
+
+import numpy as np
+import orjson
+import pandas as pd
+from numba import vectorize, int64, float64
+
+@vectorize([int64(float64)], cache=True)
+def to_sat(btc):
+    """Convert a BTC amount to integer satoshis (fused mul+round+cast)"""
+    return int64(round(btc * 100000000.0))
+
+# Resolved once at import; main() and test harnesses reuse the same map
+BASE_DIR = pathlib.Path(__file__).resolve().parent.parent
+OHLCV_DIR = BASE_DIR / 'data' / 'ohlcv'
+PATHS = {
+    'orders': BASE_DIR / 'bitmex_orders.csv',
+    'executions': BASE_DIR / 'bitmex_executions.csv',
+    'wallet': BASE_DIR / 'bitmex_wallet_history.csv',
+    'account': BASE_DIR / 'bitmex_account_summary.json',
+}
+
+# Symbols and timeframes mirror scripts/download_ohlcv.js
+SYMBOLS = ['XBTUSD', 'ETHUSD']
+TIMEFRAMES = {
+    '1d': 365 * 5,   # 5 years of daily
+    '1h': 365,       # 1 year of hourly
+    '5m': 60,        # 60 days of 5-min
+}
+
+START_PRICES = {'XBTUSD': 45000.0, 'ETHUSD': 2500.0}
+BAR_FREQS = {
+    '1m': (1440, '1min'),
+    '5m': (288, '5min'),
+    '1h': (24, '1h'),
+    '1d': (1, '1D'),
+}
+
+ORDERS_FIELDS = ['orderID', 'symbol', 'side', 'ordType', 'orderQty', 'price',
+                 'stopPx', 'avgPx', 'cumQty', 'ordStatus', 'timestamp', 'text']
+EXECUTIONS_FIELDS = ['execID', 'orderID', 'symbol', 'side', 'lastQty', 'lastPx',
+                     'execType', 'ordType', 'ordStatus', 'execCost', 'execComm',
+                     'timestamp', 'text']
+WALLET_FIELDS = ['transactID', 'account', 'currency', 'transactType', 'amount',
+                 'fee', 'transactStatus', 'address', 'tx', 'text', 'timestamp',
+                 'walletBalance', 'marginBalance']
+
+
+def generate_ohlcv_data(symbol, timeframe, days, filename, seed=None):
+    """Generate a synthetic OHLCV random walk and write it to CSV.
+
+    All randomness is drawn in bulk via numpy.random.Generator and the price
+    walk is a single cumprod, so the whole file is built without a Python
+    per-bar loop.
+    """
+    start_price = START_PRICES.get(symbol, 100.0)
+    bars_per_day, freq = BAR_FREQS.get(timeframe, (24, '1h'))
+
+    n = days * bars_per_day
+    rng = np.random.default_rng(seed)
+
+    changes = rng.standard_normal(n) * 0.002
+    opens = start_price * np.cumprod(1.0 + changes)
+    highs = opens * (1.0 + rng.uniform(0, 0.02, n))
+    lows = opens * (1.0 - rng.uniform(0, 0.02, n))
+    closes = opens * (1.0 + rng.standard_normal(n) * 0.01)
+    volumes = rng.uniform(100000, 5000000, n)
+
+    # Format all bar timestamps in one bulk strftime; feeding strings to
+    # to_csv avoids per-row datetime formatting on write
+    timestamps = pd.date_range(end=datetime.utcnow(), periods=n, freq=freq)
+    iso_timestamps = timestamps.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+    df = pd.DataFrame({
+        'timestamp': iso_timestamps,
+        'open': opens,
+        'high': highs,
+        'low': lows,
+        'close': closes,
+        'volume': volumes,
+    })
+    df = df.round({'open': 2, 'high': 2, 'low': 2, 'close': 2, 'volume': 0})
+    df.to_csv(filename, index=False)
+    return n
+
+
+def _generate_ohlcv_task(task):
+    """Pool worker: generate one OHLCV file with a deterministic derived seed"""
+    symbol, timeframe, days, filename = task
+    seed = zlib.crc32(f"{symbol}_{timeframe}".encode())
+    bars = generate_ohlcv_data(symbol, timeframe, days, filename, seed=seed)
+    return symbol, timeframe, bars, filename
+
+
+def generate_executions(days=180):
+    """Generate synthetic executions plus the matching order history.
+
+    All randomness is pre-drawn in bulk via numpy.random.Generator; the
+    remaining Python loop only assembles rows from aligned arrays.
+    """
+    rng = np.random.default_rng()
+
+    trades_per_day = rng.integers(0, 9, size=days)
+    total = int(trades_per_day.sum())
+
+    sides = rng.choice(['Buy', 'Sell'], total)
+    qtys = rng.choice([100, 500, 1000, 2000, 5000, 10000], total)
+    gauss = rng.standard_normal(total) * 0.02
+    hours = rng.integers(0, 24, total)
+    mins = rng.integers(0, 60, total)
+    ord_types = rng.choice(['Limit', 'Market'], total)
+    cancel_flags = rng.random(total) > 0.7
+
+    prices = np.maximum(45000.0 * np.cumprod(1.0 + gauss), 1000.0)
+    day_offsets = np.repeat(np.arange(days), trades_per_day)
+    exec_costs = to_sat(qtys / prices)
+
+    executions = []
+    orders = []
+    start = datetime.utcnow() - timedelta(days=days)
+
+    for i in range(total):
+        side = sides[i]
+        qty = int(qtys[i])
+        price = float(prices[i])
+        ord_type = ord_types[i]
+        ts = start + timedelta(days=int(day_offsets[i]),
+                               hours=int(hours[i]),
+                               minutes=int(mins[i]))
+        timestamp = ts.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        order_id = f"ord_{len(orders) + 1:06d}"
+        exec_cost = int(exec_costs[i])
+        exec_comm = round(exec_cost * 0.00075)
+
+        executions.append({
+            'execID': f"exec_{len(executions) + 1:06d}",
+            'orderID': order_id,
+            'symbol': 'XBTUSD',
+            'side': side,
+            'lastQty': qty,
+            'lastPx': round(price, 1),
+            'execType': 'Trade',
+            'ordType': ord_type,
+            'ordStatus': 'Filled',
+            'execCost': exec_cost,
+            'execComm': exec_comm,
+            'timestamp': timestamp,
+            'text': 'Demo execution'
+        })
+        orders.append({
+            'orderID': order_id,
+            'symbol': 'XBTUSD',
+            'side': side,
+            'ordType': ord_type,
+            'orderQty': qty,
+            'price': round(price, 1) if ord_type == 'Limit' else '',
+            'stopPx': '',
+            'avgPx': round(price, 1),
+            'cumQty': qty,
+            'ordStatus': 'Filled',
+            'timestamp': timestamp,
+            'text': 'Demo order'
+        })
+
+        # Occasionally leave behind a canceled resting order
+        if cancel_flags[i]:
+            orders.append({
+                'orderID': f"ord_{len(orders) + 1:06d}",
+                'symbol': 'XBTUSD',
+                'side': side,
+                'ordType': 'Limit',
+                'orderQty': qty,
+                'price': round(price * 0.99, 1),
+                'stopPx': '',
+                'avgPx': '',
+                'cumQty': 0,
+                'ordStatus': 'Canceled',
+                'timestamp': timestamp,
+                'text': 'Demo canceled order'
+            })
+
+    return executions, orders
+
+
+def generate_wallet_history(days=180):
+    """Generate a synthetic wallet ledger with daily PnL and funding entries.
+
+    All randomness is pre-drawn in bulk via numpy.random.Generator; the
+    loop only assembles rows and tracks the running balance.
+    """
+    rng = np.random.default_rng()
+
+    pnls = rng.normal(0.001, 0.005, days)
+    funding_rates = rng.normal(0, 0.0001, days)
+    include_funding = rng.random(days) > 0.7
+    amounts_sat = to_sat(pnls)
+
+    history = []
+    balance = 1.0
+    start = datetime.utcnow() - timedelta(days=days)
+
+    for day in range(days):
+        balance += pnls[day]
+        ts = start + timedelta(days=day, hours=12)
+        history.append({
+            'transactID': f"txn_{len(history) + 1:06d}",
+            'account': 100001,
+            'currency': 'XBt',
+            'transactType': 'RealisedPNL',
+            'amount': int(amounts_sat[day]),
+            'fee': 0,
+            'transactStatus': 'Completed',
+            'address': '',
+            'tx': '',
+            'text': 'Daily realised PnL',
+            'timestamp': ts.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'walletBalance': int(to_sat(balance)),
+            'marginBalance': ''
+        })
+
+        if include_funding[day]:
+            funding = funding_rates[day] * balance
+            balance += funding
+            history.append({
+                'transactID': f"txn_{len(history) + 1:06d}",
+                'account': 100001,
+                'currency': 'XBt',
+                'transactType': 'Funding',
+                'amount': int(to_sat(funding)),
+                'fee': 0,
+                'transactStatus': 'Completed',
+                'address': '',
+                'tx': '',
+                'text': 'Funding payment',
+                'timestamp': ts.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'walletBalance': int(to_sat(balance)),
+                'marginBalance': ''
+            })
+
+    return history
+
+
+def generate_account_summary(wallet_history):
+    """Build the account summary JSON from the generated wallet ledger"""
+    wallet_balance = wallet_history[-1]['walletBalance'] if wallet_history else 0
+    realised = sum(w['amount'] for w in wallet_history
+                   if w['transactType'] == 'RealisedPNL')
+    return {
+        'exportDate': datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'user': {
+            'id': 100001,
+            'username': 'demo_trader',
+            'email': 'demo@example.com'
+        },
+        'wallet': {
+            'walletBalance': wallet_balance,
+            'marginBalance': wallet_balance,
+            'availableMargin': wallet_balance,
+            'unrealisedPnl': 0,
+            'realisedPnl': realised
+        },
+        'positions': []
+    }
+
+
+def save_csv(rows, fieldnames, filename):
+    """Stream rows to CSV as pre-ordered tuples via csv.writer"""
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(tuple(row[field] for field in fieldnames)
+                         for row in rows)
+
+
+def main():
+    OHLCV_DIR.mkdir(parents=True, exist_ok=True)
+
+    print("═" * 60)
+    print("        Demo Data Generation")
+    print("═" * 60)
+    print()
+
+    print("Generating OHLCV data...")
+    tasks = [(symbol, timeframe, days, OHLCV_DIR / f"{symbol}_{timeframe}.csv")
+             for symbol in SYMBOLS
+             for timeframe, days in TIMEFRAMES.items()]
+
+    with multiprocessing.Pool(processes=min(len(tasks), os.cpu_count() or 1)) as pool:
+        for symbol, timeframe, bars, filename in pool.imap_unordered(_generate_ohlcv_task, tasks):
+            print(f"  ✅ {symbol} {timeframe}: {bars} bars -> {filename}")
+
+    print()
+    print("Generating trading history...")
+    executions, orders = generate_executions()
+    wallet_history = generate_wallet_history()
+    account = generate_account_summary(wallet_history)
+
+    save_csv(orders, ORDERS_FIELDS, PATHS['orders'])
+    save_csv(executions, EXECUTIONS_FIELDS, PATHS['executions'])
+    save_csv(wallet_history, WALLET_FIELDS, PATHS['wallet'])
+
+    with open(PATHS['account'], 'wb') as f:
+        f.write(orjson.dumps(account, option=orjson.OPT_INDENT_2))
+
+    print(f"  Orders: {len(orders)}")
+    print(f"  Executions: {len(executions)}")
+    print(f"  Wallet entries: {len(wallet_history)}")
+    print()
+    print("═" * 60)
+    print("✅ Demo data generation complete!")
+    print("═" * 60)
+
+
+if __name__ == '__main__':
+    main()